@@ -13,11 +13,13 @@ def compute_binary_diff_stub(
     """
     syms_from = {f.value: f for f in features_from if f.feature_type == "symbols"}
     syms_to = {f.value: f for f in features_to if f.feature_type == "symbols"}
-    stubs: list[BinaryDiffStub] = []
+    matched: list[BinaryDiffStub] = []
+    added: list[BinaryDiffStub] = []
+    # One pass, one probe per symbol; two lists keep matches before additions in "to" order.
     for name, f_to in syms_to.items():
         f_from = syms_from.get(name)
         if f_from:
-            stubs.append(
+            matched.append(
                 BinaryDiffStub(
                     from_function=name,
                     to_function=name,
@@ -26,16 +28,15 @@ def compute_binary_diff_stub(
                     similarity_note="matched by name (stub)",
                 )
             )
-    # New symbols in "to" (added)
-    for name in syms_to:
-        if name not in syms_from:
-            stubs.append(
+        else:
+            # New symbols in "to" (added)
+            added.append(
                 BinaryDiffStub(
                     from_function="",
                     to_function=name,
                     from_address=None,
-                    to_address=syms_to[name].address,
+                    to_address=f_to.address,
                     similarity_note="added in to build",
                 )
             )
-    return stubs
+    return matched + added
@@ -1,39 +1,73 @@
 """Binary feature extraction: strings, imports, symbols, ObjC metadata (deterministic)."""
 
-import re
+import itertools
+import mmap
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from oss_sensor.models import BinaryFeature
+import numpy as np
 
+from oss_sensor.models import BinaryFeature
 
-def _read_strings(path: Path, min_len: int = 6) -> list[str]:
-    """Extract printable ASCII strings from binary (simplified; production: use 'strings' or lief)."""
-    data = path.read_bytes()
-    pattern = re.compile(rb"[\x20-\x7e]{" + str(min_len).encode() + rb",}")
-    return [m.decode("ascii", errors="replace") for m in pattern.findall(data)]
+# Mach-O magic (32-bit, 64-bit, fat)
+MACHO_MAGICS = frozenset({b"\xfe\xed\xfa\xce", b"\xfe\xed\xfa\xcf", b"\xca\xfe\xba\xbe"})
+# Distinct strings kept per binary artifact
+MAX_STRINGS = 2000
+# Printable ASCII range for _read_strings, as uint8 scalars so the scan stays in uint8.
+_PRINTABLE_LO = np.uint8(0x20)
+_PRINTABLE_SPAN = np.uint8(0x7F - 0x20)
 
 
-def _fake_imports(path: Path) -> list[str]:
-    """Stub: return placeholder imports; production would use otool -L / parse Mach-O."""
+def _read_strings(data: bytes | mmap.mmap, min_len: int = 6) -> list[str]:
+    """Extract printable ASCII strings from binary (simplified; production: use 'strings' or lief)."""
+    arr = np.frombuffer(data, dtype=np.uint8)
+    # 0x20..0x7e in one unsigned compare: bytes below 0x20 wrap around to >= 0xe0.
+    printable = (arr - _PRINTABLE_LO) < _PRINTABLE_SPAN
+    # Run boundaries of printable bytes come in (start, end) pairs once padded with False.
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], printable, [False])).view(np.int8)))
+    starts, ends = edges[::2], edges[1::2]
+    keep = (ends - starts) >= min_len
     return [
-        "/usr/lib/libSystem.B.dylib",
-        "/usr/lib/libobjc.A.dylib",
+        data[s:e].decode("ascii", errors="replace")
+        for s, e in zip(starts[keep].tolist(), ends[keep].tolist())
     ]
 
 
-def _fake_symbols(path: Path) -> list[str]:
-    """Stub: return placeholder symbols; production would use nm or dyld info."""
-    return [
-        "_main",
-        "_malloc",
-        "_free",
-    ]
+# Stub features until Mach-O load commands are parsed (production: otool -L for imports, nm or
+# dyld info for symbols, class-dump or otool -ov for ObjC). Shared constants, not rebuilt per file.
+_STUB_FEATURES: dict[str, Any] = {
+    "imports": ("/usr/lib/libSystem.B.dylib", "/usr/lib/libobjc.A.dylib"),
+    "symbols": ("_main", "_malloc", "_free"),
+    "objc_metadata": {},
+}
+
+
+def _scan_one(p: Path) -> dict[str, Any] | None:
+    """Extract features from a single file; None if it is not a readable Mach-O."""
+    try:
+        with p.open("rb") as fh:
+            if fh.read(4) not in MACHO_MAGICS:
+                return None
+            # Map read-only so only the pages the string scan touches are faulted in.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Dedupe per file (order-preserving) to shrink what workers send back.
+                return {"strings": list(dict.fromkeys(_read_strings(mm))), **_STUB_FEATURES}
+    except Exception:
+        return None
 
 
-def _fake_objc(path: Path) -> dict[str, Any]:
-    """Stub: ObjC metadata if present; production would use class-dump or otool -ov."""
-    return {}
+def _dedup_capped(chunks: Iterable[Iterable[str]], cap: int) -> list[str]:
+    """First `cap` distinct strings across chunks, in order; stops consuming once full."""
+    seen: dict[str, None] = {}
+    for s in itertools.chain.from_iterable(chunks):
+        if s not in seen:
+            seen[s] = None
+            if len(seen) >= cap:
+                break
+    return list(seen)
 
 
 def extract_binary_features(macho_dir: Path) -> dict[str, Any]:
@@ -41,6 +75,7 @@ def extract_binary_features(macho_dir: Path) -> dict[str, Any]:
     Extract deterministic features from Mach-O(s) in directory.
     Returns dict suitable for storage: strings, imports, symbols, objc_metadata.
     All entries are lists or dicts keyed by file name for multi-binary dirs.
+    Files are scanned in parallel worker processes when there is more than one.
     """
     result: dict[str, Any] = {
         "strings": [],
@@ -49,22 +84,21 @@ def extract_binary_features(macho_dir: Path) -> dict[str, Any]:
         "objc_metadata": {},
     }
     files = list(macho_dir.iterdir()) if macho_dir.is_dir() else [macho_dir]
-    for p in files:
-        if not p.is_file():
-            continue
-        try:
-            raw = p.read_bytes()[:4]
-            # Mach-O magic
-            if raw in (b"\xfe\xed\xfa\xce", b"\xfe\xed\xfa\xcf", b"\xca\xfe\xba\xbe"):
-                result["strings"].extend(_read_strings(p))
-                result["imports"].extend(_fake_imports(p))
-                result["symbols"].extend(_fake_symbols(p))
-                objc = _fake_objc(p)
-                if objc:
-                    result["objc_metadata"][p.name] = objc
-        except Exception:
-            pass
-    result["strings"] = list(dict.fromkeys(result["strings"]))[:2000]  # dedupe, cap
+    paths = [p for p in files if p.is_file()]
+    if len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+            scanned = list(ex.map(_scan_one, paths))
+    else:
+        scanned = [_scan_one(p) for p in paths]
+    # Merge in directory order so dedupe below keeps the same first occurrences as a serial scan.
+    found = [(p, feats) for p, feats in zip(paths, scanned) if feats is not None]
+    for p, feats in found:
+        result["imports"].extend(feats["imports"])
+        result["symbols"].extend(feats["symbols"])
+        if feats["objc_metadata"]:
+            result["objc_metadata"][p.name] = feats["objc_metadata"]
+    # Dedupe and cap strings as they stream in, without concatenating every file's strings first.
+    result["strings"] = _dedup_capped((feats["strings"] for _, feats in found), MAX_STRINGS)
     result["imports"] = list(dict.fromkeys(result["imports"]))
     result["symbols"] = list(dict.fromkeys(result["symbols"]))
     return result
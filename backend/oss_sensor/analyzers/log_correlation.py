@@ -1,61 +1,115 @@
 """Log correlation: extract message templates, match to binary strings."""
 
+import hashlib
+import itertools
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import ahocorasick
+
 from oss_sensor.models import LogTemplate
 
+_FORMAT_SPEC_RE = re.compile(r"%[@dDsSuUxXfF]")
+
+
+def _template_candidates(p: Path) -> list[tuple[str, str]]:
+    """Candidate (format_string, sample_message) pairs from one log file, first occurrence only."""
+    out: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    try:
+        # Only the head of each file is inspected; never read the rest of a large log.
+        with p.open(errors="ignore") as fh:
+            head = [line.rstrip("\n") for line in itertools.islice(fh, 500)]
+    except Exception:
+        return out
+    # Simple template: lines with %@, %d, %s, %u etc.
+    for line in head:
+        if "%" not in line:
+            continue
+        # Normalize to template: specifiers to %@ in the same pass that detects them
+        tpl, n_specs = _FORMAT_SPEC_RE.subn("%@", line)
+        if n_specs:
+            tpl = " ".join(tpl.split())
+            if len(tpl) < 200 and tpl not in seen:
+                seen.add(tpl)
+                out.append((tpl, line.strip()[:200]))
+    # Also treat unique short lines as potential templates
+    for line in head[:200]:
+        line = line.strip()
+        if 10 < len(line) < 120 and " " in line and line not in seen:
+            seen.add(line)
+            out.append((line, line[:200]))
+    return out
+
+
+def _template_matcher(tpl: str) -> re.Pattern[str]:
+    """Regex for a normalized template; each %@ placeholder matches within a single token."""
+    return re.compile(
+        " ".join(r"\S*".join(map(re.escape, tok.split("%@"))) for tok in tpl.split(" "))
+    )
+
+
+def _literal_tokens(tokens: list[str], slots: tuple[int, ...]) -> tuple[str, ...]:
+    """Tokens outside the placeholder positions `slots`."""
+    return tuple(tok for i, tok in enumerate(tokens) if i not in slots)
+
 
 def extract_log_templates(log_dir: Path) -> list[LogTemplate]:
     """
     Extract message templates from logarchive or crash dir.
     Synthetic: look for format-string-like lines; production would parse os_log content.
+    Files are scanned in parallel worker processes when there is more than one.
     """
     templates: list[LogTemplate] = []
     seen: set[str] = set()
+    # Template memory: a candidate that an earlier placeholder template already explains (e.g. the
+    # raw line behind "count=%@") is not a new template. Templates are grouped by token count and
+    # placeholder positions, then keyed by their literal tokens, which any matching line repeats
+    # verbatim. A lookup is one dict probe per placeholder layout, and only the templates it finds
+    # are compiled, instead of matching every earlier template.
+    memory: dict[int, dict[tuple[int, ...], dict[tuple[str, ...], list[str]]]] = {}
     if not log_dir.exists():
         return templates
-    for p in log_dir.rglob("*"):
-        if not p.is_file():
-            continue
-        try:
-            text = p.read_text(errors="ignore")
-        except Exception:
-            continue
-        # Simple template: lines with %@, %d, %s, %u etc.
-        for line in text.splitlines()[:500]:
-            if "%" in line and re.search(r"%[@dDsSuUxXfF]", line):
-                # Normalize to template
-                tpl = re.sub(r"%[@dDsSuUxXfF]", "%@", line)
-                tpl = re.sub(r"\s+", " ", tpl).strip()
-                if len(tpl) < 200 and tpl not in seen:
-                    seen.add(tpl)
-                    tid = f"tpl_{abs(hash(tpl)) % 10**8}"
-                    templates.append(
-                        LogTemplate(
-                            template_id=tid,
-                            subsystem="default",
-                            category="default",
-                            format_string=tpl,
-                            sample_messages=[line.strip()[:200]],
-                        )
-                    )
-        # Also treat unique short lines as potential templates
-        for line in text.splitlines()[:200]:
-            line = line.strip()
-            if 10 < len(line) < 120 and " " in line and line not in seen:
-                seen.add(line)
-                tid = f"tpl_{abs(hash(line)) % 10**8}"
-                templates.append(
-                    LogTemplate(
-                        template_id=tid,
-                        subsystem="default",
-                        category="default",
-                        format_string=line,
-                        sample_messages=[line[:200]],
-                    )
+    paths = [p for p in log_dir.rglob("*") if p.is_file()]
+    if len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+            per_file = list(ex.map(_template_candidates, paths))
+    else:
+        per_file = [_template_candidates(p) for p in paths]
+    # Merge in file order; first occurrence across files wins, as with a serial scan.
+    for candidates in per_file:
+        for tpl, sample in candidates:
+            if tpl in seen:
+                continue
+            tokens = tpl.split()
+            normalized = " ".join(tokens)
+            layouts = memory.get(len(tokens), {})
+            if any(
+                _template_matcher(known).fullmatch(normalized)
+                for slots, by_literals in layouts.items()
+                for known in by_literals.get(_literal_tokens(tokens, slots), ())
+            ):
+                continue
+            seen.add(tpl)
+            if "%@" in tpl:
+                slots = tuple(i for i, tok in enumerate(tokens) if "%@" in tok)
+                by_literals = memory.setdefault(len(tokens), {}).setdefault(slots, {})
+                by_literals.setdefault(_literal_tokens(tokens, slots), []).append(normalized)
+            # Content-derived, so the same template gets the same ID in every process and run
+            # (builtin hash() is salted per process).
+            tid = f"tpl_{hashlib.blake2b(tpl.encode(), digest_size=5).hexdigest()}"
+            templates.append(
+                LogTemplate(
+                    template_id=tid,
+                    subsystem="default",
+                    category="default",
+                    format_string=tpl,
+                    sample_messages=[sample],
                 )
+            )
     return templates[:100]
 
 
@@ -65,15 +119,52 @@ def correlate_log_to_binary(
 ) -> list[tuple[str, str]]:
     """Match log template format strings (or samples) to binary string table. Returns (template_id, string)."""
     pairs: list[tuple[str, str]] = []
-    str_set = set(binary_strings)
+    if not binary_strings:
+        return pairs
+    str_set = frozenset(binary_strings)
+    candidates = {s for t in templates for s in (t.format_string, *t.sample_messages)}
+    if not candidates:
+        return pairs
+    prefixes = {s[:50] for s in candidates}
+    # Length pruning: b can only be `in s` if it is no longer than the longest candidate, and a
+    # prefix can only be `in b` if it is no longer than b.
+    max_candidate_len = max(map(len, candidates))
+    max_bin_len = max(map(len, binary_strings))
+    min_prefix_len = min(len(p) for p in prefixes if p) if any(prefixes) else 0
+
+    # Binary strings as patterns: one scan of s yields every b with `b in s`.
+    bin_automaton = ahocorasick.Automaton()
+    for idx, b in enumerate(binary_strings):
+        if b and len(b) <= max_candidate_len and b not in bin_automaton:
+            bin_automaton.add_word(b, idx)
+    if len(bin_automaton):
+        bin_automaton.make_automaton()
+    empty_idx = [binary_strings.index("")] if "" in str_set else []  # "" is in every s
+    # Template prefixes as patterns: one scan of each b yields every prefix with `s[:50] in b`.
+    # Scanning in order means the first hit recorded per prefix is the earliest binary string.
+    first_containing: dict[str, int] = {"": 0}
+    prefix_automaton = ahocorasick.Automaton()
+    for prefix in prefixes:
+        if prefix and len(prefix) <= max_bin_len:
+            prefix_automaton.add_word(prefix, prefix)
+    if len(prefix_automaton):
+        prefix_automaton.make_automaton()
+        for idx, b in enumerate(binary_strings):
+            if len(b) < min_prefix_len:
+                continue
+            for _, prefix in prefix_automaton.iter(b):
+                first_containing.setdefault(prefix, idx)
+
     for t in templates:
         for s in (t.format_string, *t.sample_messages):
             if s in str_set:
                 pairs.append((t.template_id, s))
                 break
-            # Substring match
-            for b in binary_strings:
-                if s[:50] in b or b in s:
-                    pairs.append((t.template_id, b))
-                    break
+            # Substring match: earliest binary string containing s[:50] or contained in s
+            hits = [idx for _, idx in bin_automaton.iter(s)] if len(bin_automaton) else []
+            hits.extend(empty_idx)
+            if s[:50] in first_containing:
+                hits.append(first_containing[s[:50]])
+            if hits:
+                pairs.append((t.template_id, binary_strings[min(hits)]))
     return pairs
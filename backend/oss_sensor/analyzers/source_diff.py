@@ -1,7 +1,9 @@
 """Source diff extraction and deterministic feature extraction (alloc math, bounds, parsing, privilege)."""
 
+import difflib
 import re
 import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator
 
@@ -14,7 +16,20 @@ def _normalize_line(line: str) -> str:
 
 def _hunk_id(file_path: str, old_start: int, new_start: int, lines: list[str]) -> str:
     content = f"{file_path}:{old_start}:{new_start}:" + "|".join(lines[:5])
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    # Identity only, not security: a native 64-bit digest instead of truncated SHA-256.
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _read_lines(path_str: str, mtime_ns: int) -> list[str]:
+    """Memoized read keyed by path and mtime, so an edited file is re-read. Callers must not mutate."""
+    return Path(path_str).read_text(errors="ignore").splitlines()
+
+
+def _file_lines(path: Path) -> list[str]:
+    if not path.exists():
+        return []
+    return _read_lines(str(path), path.stat().st_mtime_ns)
 
 
 def parse_unified_hunks(
@@ -23,62 +38,33 @@ def parse_unified_hunks(
     file_pairs: list[tuple[Path, Path]],
 ) -> list[DiffHunk]:
     """Produce diff hunks between two directory trees for given file pairs.
-    Uses simple line-by-line diff; in production could use difflib.unified_diff.
+    Uses difflib.SequenceMatcher opcodes; one hunk per contiguous non-equal block (no context).
     """
     hunks: list[DiffHunk] = []
     for from_path, to_path in file_pairs:
-        from_lines = from_path.read_text().splitlines() if from_path.exists() else []
-        to_lines = to_path.read_text().splitlines() if to_path.exists() else []
-        # Simple diff: find contiguous blocks of changes
-        i, j = 0, 0
-        old_start, old_count = 0, 0
-        new_start, new_count = 0, 0
-        chunk: list[str] = []
-        while i < len(from_lines) or j < len(to_lines):
-            if i < len(from_lines) and j < len(to_lines) and from_lines[i] == to_lines[j]:
-                if chunk:
-                    hid = _hunk_id(str(from_path), old_start, new_start, chunk)
-                    hunks.append(
-                        DiffHunk(
-                            file_path=str(from_path.relative_to(from_dir) if from_dir != from_path else from_path.name),
-                            old_start=old_start,
-                            old_count=old_count,
-                            new_start=new_start,
-                            new_count=new_count,
-                            lines=chunk,
-                            hunk_id=hid,
-                        )
-                    )
-                    chunk = []
-                i += 1
-                j += 1
+        from_lines = _file_lines(from_path)
+        to_lines = _file_lines(to_path)
+        rel_path = str(from_path.relative_to(from_dir) if from_dir != from_path else from_path.name)
+        # Intern each distinct line to a small int so the matcher compares and hashes ints;
+        # hunk text is still sliced from the original line lists.
+        line_ids: dict[str, int] = {}
+        a = [line_ids.setdefault(line, len(line_ids)) for line in from_lines]
+        b = [line_ids.setdefault(line, len(line_ids)) for line in to_lines]
+        sm = difflib.SequenceMatcher(None, a, b, autojunk=False)
+        for tag, i1, i2, j1, j2 in sm.get_opcodes():
+            if tag == "equal":
                 continue
-            if chunk == []:
-                old_start = i + 1
-                new_start = j + 1
-                old_count = 0
-                new_count = 0
-            if i < len(from_lines):
-                chunk.append("- " + _normalize_line(from_lines[i]))
-                old_count += 1
-                i += 1
-            if j < len(to_lines) and (not chunk or not chunk[-1].startswith("+ ")):
-                if chunk and chunk[-1].startswith("- "):
-                    pass  # already advanced i
-                chunk.append("+ " + _normalize_line(to_lines[j]))
-                new_count += 1
-                j += 1
-        if chunk:
-            hid = _hunk_id(str(from_path), old_start, new_start, chunk)
+            chunk = ["- " + _normalize_line(line) for line in from_lines[i1:i2]]
+            chunk.extend("+ " + _normalize_line(line) for line in to_lines[j1:j2])
             hunks.append(
                 DiffHunk(
-                    file_path=str(from_path.relative_to(from_dir) if from_dir != from_path else from_path.name),
-                    old_start=old_start,
-                    old_count=old_count,
-                    new_start=new_start,
-                    new_count=new_count,
+                    file_path=rel_path,
+                    old_start=i1 + 1,
+                    old_count=i2 - i1,
+                    new_start=j1 + 1,
+                    new_count=j2 - j1,
                     lines=chunk,
-                    hunk_id=hid,
+                    hunk_id=_hunk_id(str(from_path), i1 + 1, j1 + 1, chunk),
                 )
             )
     return hunks
@@ -116,34 +102,58 @@ PRIVILEGE_PATTERNS = [
 ]
 
 
+def _union(patterns: list[re.Pattern[str]]) -> re.Pattern[str]:
+    """One compiled alternation so a single search() covers the whole category."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.I)
+
+
+ALLOC_MATH_RE = _union(ALLOC_MATH_PATTERNS)
+BOUNDS_CHECK_RE = _union(BOUNDS_CHECK_PATTERNS)
+PARSING_RE = _union(PARSING_PATTERNS)
+PRIVILEGE_RE = _union(PRIVILEGE_PATTERNS)
+_CATEGORY_RES = [
+    (ALLOC_MATH_RE, "alloc_math"),
+    (BOUNDS_CHECK_RE, "bounds_check"),
+    (PARSING_RE, "parsing"),
+    (PRIVILEGE_RE, "privilege_check"),
+]
+# All categories in one alternation: a single scan rules out hunks that match nothing.
+ANY_FEATURE_RE = _union(
+    ALLOC_MATH_PATTERNS + BOUNDS_CHECK_PATTERNS + PARSING_PATTERNS + PRIVILEGE_PATTERNS
+)
+
+
 def extract_source_features(hunks: list[DiffHunk]) -> list[SourceFeature]:
     """Extract deterministic features from diff hunks (alloc math, bounds, parsing, privilege)."""
     features: list[SourceFeature] = []
     for hunk in hunks:
         snippet = "\n".join(hunk.lines[:20])
+        if not ANY_FEATURE_RE.search(snippet):
+            continue
         line_range = (hunk.old_start, hunk.old_start + hunk.old_count)
-        for pattern_list, ftype in [
-            (ALLOC_MATH_PATTERNS, "alloc_math"),
-            (BOUNDS_CHECK_PATTERNS, "bounds_check"),
-            (PARSING_PATTERNS, "parsing"),
-            (PRIVILEGE_PATTERNS, "privilege_check"),
-        ]:
-            for p in pattern_list:
-                if p.search(snippet):
-                    features.append(
-                        SourceFeature(
-                            feature_type=ftype,
-                            description=f"Pattern match: {ftype}",
-                            hunk_id=hunk.hunk_id,
-                            file_path=hunk.file_path,
-                            line_range=line_range,
-                            snippet=snippet[:500],
-                        )
+        stored_snippet = snippet[:500]
+        for category_re, ftype in _CATEGORY_RES:
+            if category_re.search(snippet):
+                features.append(
+                    SourceFeature(
+                        feature_type=ftype,
+                        description=f"Pattern match: {ftype}",
+                        hunk_id=hunk.hunk_id,
+                        file_path=hunk.file_path,
+                        line_range=line_range,
+                        snippet=stored_snippet,
                     )
-                    break
+                )
     return features
 
 
+def _rel_files(root: Path) -> list[Path]:
+    """Relative paths of non-hidden files under root, in walk order."""
+    return [
+        f.relative_to(root) for f in root.rglob("*") if f.is_file() and not f.name.startswith(".")
+    ]
+
+
 def extract_source_diff(
     from_dir: Path,
     to_dir: Path,
@@ -156,26 +166,10 @@ def extract_source_diff(
     """
     from_dir = Path(from_dir)
     to_dir = Path(to_dir)
-    file_pairs: list[tuple[Path, Path]] = []
-    for f in from_dir.rglob("*"):
-        if f.is_file() and not f.name.startswith("."):
-            rel = f.relative_to(from_dir)
-            to_path = to_dir / rel
-            file_pairs.append((f, to_path))
-    for f in to_dir.rglob("*"):
-        if f.is_file() and not f.name.startswith("."):
-            rel = f.relative_to(to_dir)
-            from_path = from_dir / rel
-            if (from_path, f) not in [(a, b) for a, b in file_pairs]:
-                file_pairs.append((from_path, f))
-    # Dedupe by relative path
-    seen: set[str] = set()
-    unique_pairs: list[tuple[Path, Path]] = []
-    for a, b in file_pairs:
-        key = str(a.relative_to(from_dir) if a.is_relative_to(from_dir) else a.name)
-        if key not in seen:
-            seen.add(key)
-            unique_pairs.append((a, b))
+    # One pair per relative path: files in from_dir (walk order), then files only in to_dir.
+    rels = dict.fromkeys(_rel_files(from_dir))
+    rels.update(dict.fromkeys(_rel_files(to_dir)))
+    unique_pairs = [(from_dir / rel, to_dir / rel) for rel in rels]
     hunks = parse_unified_hunks(from_dir, to_dir, unique_pairs)
     features = extract_source_features(hunks)
     return hunks, features
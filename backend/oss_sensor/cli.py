@@ -20,6 +20,7 @@ from oss_sensor.analyzers import (
 from oss_sensor.analyzers.binary_features import features_to_list
 from oss_sensor.scoring import score_diff
 from oss_sensor.reports import (
+    evidence_refs_from_bundle,
     generate_triage_report,
     generate_reverse_context_report,
     generate_vuln_hypotheses,
@@ -36,6 +37,13 @@ def _run(coro):
     return asyncio.run(coro)
 
 
+async def _open_storage() -> Storage:
+    """Storage for one CLI invocation, schema ensured once."""
+    storage = Storage(Settings())
+    await storage.init_db()
+    return storage
+
+
 @app.command()
 def ingest_source(
     build_id: str = typer.Option(..., "--build-id"),
@@ -52,9 +60,7 @@ def ingest_source(
         features["files"] = [str(p.relative_to(path_obj)) for p in path_obj.rglob("*") if p.is_file()][:5000]
 
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
         aid = await storage.store_artifact(
             build_id=build_id,
             component=component,
@@ -82,9 +88,7 @@ def ingest_binary(
     features = extract_binary_features(path_obj)
 
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
         aid = await storage.store_artifact(
             build_id=build_id,
             component=component,
@@ -112,9 +116,7 @@ def ingest_logs(
     features = [t.model_dump() for t in templates]
 
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
         aid = await storage.store_artifact(
             build_id=build_id,
             component="logs",
@@ -136,13 +138,19 @@ def diff(
 ) -> None:
     """Compute diff between two builds for a component."""
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
+
+        # Artifact lookups are independent; overlap them.
+        from_src, to_src, from_bin, to_bin, from_logs, to_logs = await asyncio.gather(
+            storage.list_artifacts(build_id=from_build, component=component, kind=ArtifactKind.SOURCE),
+            storage.list_artifacts(build_id=to_build, component=component, kind=ArtifactKind.SOURCE),
+            storage.list_artifacts(build_id=from_build, component=component, kind=ArtifactKind.BINARY),
+            storage.list_artifacts(build_id=to_build, component=component, kind=ArtifactKind.BINARY),
+            storage.list_artifacts(build_id=from_build, component="logs", kind=ArtifactKind.LOG),
+            storage.list_artifacts(build_id=to_build, component="logs", kind=ArtifactKind.LOG),
+        )
 
         # Source artifacts (paths)
-        from_src = await storage.list_artifacts(build_id=from_build, component=component, kind=ArtifactKind.SOURCE)
-        to_src = await storage.list_artifacts(build_id=to_build, component=component, kind=ArtifactKind.SOURCE)
         from_path = Path(from_src[0].path) if from_src else None
         to_path = Path(to_src[0].path) if to_src else None
 
@@ -151,29 +159,26 @@ def diff(
         if from_path and to_path and from_path.exists() and to_path.exists():
             hunks, source_features = extract_source_diff(from_path, to_path, component)
 
-        # Binary features
-        from_bin = await storage.list_artifacts(build_id=from_build, component=component, kind=ArtifactKind.BINARY)
-        to_bin = await storage.list_artifacts(build_id=to_build, component=component, kind=ArtifactKind.BINARY)
+        # Binary features (and to-build log templates), fetched concurrently
+        async def _features(artifacts: list) -> dict | list | None:
+            return await storage.get_artifact_features(artifacts[0].artifact_id) if artifacts else None
+
+        feats_from, feats_to, tpl_feats = await asyncio.gather(
+            _features(from_bin), _features(to_bin), _features(to_logs)
+        )
         bin_features_from: list = []
         bin_features_to: list = []
-        if from_bin:
-            feats = await storage.get_artifact_features(from_bin[0].artifact_id)
-            if feats and isinstance(feats, dict):
-                bin_features_from = features_to_list(feats, from_bin[0].artifact_id)
-        if to_bin:
-            feats = await storage.get_artifact_features(to_bin[0].artifact_id)
-            if feats and isinstance(feats, dict):
-                bin_features_to = features_to_list(feats, to_bin[0].artifact_id)
+        if feats_from and isinstance(feats_from, dict):
+            bin_features_from = features_to_list(feats_from, from_bin[0].artifact_id)
+        if feats_to and isinstance(feats_to, dict):
+            bin_features_to = features_to_list(feats_to, to_bin[0].artifact_id)
 
         binary_diff_pairs = compute_binary_diff_stub(bin_features_from, bin_features_to)
 
         # Log templates and correlation
-        from_logs = await storage.list_artifacts(build_id=from_build, component="logs", kind=ArtifactKind.LOG)
-        to_logs = await storage.list_artifacts(build_id=to_build, component="logs", kind=ArtifactKind.LOG)
         log_templates: list = []
         log_to_binary_matches: list = []
         if to_logs:
-            tpl_feats = await storage.get_artifact_features(to_logs[0].artifact_id)
             if tpl_feats and isinstance(tpl_feats, list):
                 from oss_sensor.models import LogTemplate
                 log_templates = [LogTemplate(**x) for x in tpl_feats if isinstance(x, dict)]
@@ -202,14 +207,11 @@ def score(
 ) -> None:
     """Score a diff and store result."""
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
         row = await storage.get_diff(diff_id)
         if not row or not row.evidence_bundle_json:
             return None
-        from oss_sensor.models import EvidenceBundle
-        bundle = EvidenceBundle.model_validate_json(row.evidence_bundle_json)
+        bundle = storage.evidence_bundle(row)
         result = score_diff(str(diff_id), bundle)
         await storage.set_diff_score(diff_id, result)
         return result
@@ -228,18 +230,12 @@ def report(
 ) -> None:
     """Generate reports for a diff (optionally with LLM enrichment)."""
     async def _do():
-        settings = Settings()
-        storage = Storage(settings)
-        await storage.init_db()
+        storage = await _open_storage()
+        settings = storage.settings
         row = await storage.get_diff(diff_id)
         if not row:
             return False
-        bundle = (
-            __import__("oss_sensor.models", fromlist=["EvidenceBundle"])
-            .EvidenceBundle.model_validate_json(row.evidence_bundle_json)
-            if row.evidence_bundle_json
-            else EvidenceBundle()
-        )
+        bundle = storage.evidence_bundle(row)
         score_result = (
             ScoreResult.model_validate_json(row.score_result_json)
             if row.score_result_json
@@ -248,25 +244,20 @@ def report(
         llm = get_llm_provider(settings) if with_llm else get_llm_provider(Settings())
 
         score_result = score_result or ScoreResult(total_score=0, reasons=[], diff_id=str(diff_id))
-        triage = generate_triage_report(str(diff_id), score_result, bundle, settings)
-        triage = llm.enrich_triage(str(diff_id), score_result, bundle, triage)
-        await storage.store_report(diff_id, "triage", triage)
-
-        rev = generate_reverse_context_report(str(diff_id), bundle, settings)
-        rev = llm.enrich_reverse_context(str(diff_id), bundle, rev)
-        await storage.store_report(diff_id, "reverse_context", rev)
-
-        hyp = generate_vuln_hypotheses(str(diff_id), bundle, score_result, settings)
-        hyp = llm.enrich_hypotheses(str(diff_id), bundle, hyp)
-        await storage.store_report(diff_id, "vuln_hypotheses", hyp)
-
-        fuzz = generate_fuzz_plan(str(diff_id), bundle, settings)
-        fuzz = llm.enrich_fuzz_plan(str(diff_id), bundle, fuzz)
-        await storage.store_report(diff_id, "fuzz_plan", fuzz)
-
-        tele = generate_telemetry_recommendations(str(diff_id), bundle, settings)
-        tele = llm.enrich_telemetry(str(diff_id), bundle, tele)
-        await storage.store_report(diff_id, "telemetry", tele)
+        did = str(diff_id)
+
+        # The five reports are independent over the same bundle; the provider enriches them together.
+        # Reverse context and fuzz plan cite the same refs: scan the bundle for them once.
+        refs = evidence_refs_from_bundle(bundle)
+        bases = {
+            "triage": generate_triage_report(did, score_result, bundle, settings),
+            "reverse_context": generate_reverse_context_report(did, bundle, settings, refs=refs),
+            "vuln_hypotheses": generate_vuln_hypotheses(did, bundle, score_result, settings),
+            "fuzz_plan": generate_fuzz_plan(did, bundle, settings, refs=refs),
+            "telemetry": generate_telemetry_recommendations(did, bundle, settings),
+        }
+        enriched = await llm.aenrich_all(did, score_result, bundle, bases)
+        await storage.store_reports(diff_id, enriched)
 
         return True
 
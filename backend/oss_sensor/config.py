@@ -20,6 +20,9 @@ class Settings(BaseSettings):
 
     storage_mode: StorageMode = StorageMode.DERIVED_FEATURES_ONLY
     database_url: str = "sqlite+aiosqlite:///./data/oss_sensor.db"
+    # Connection pool shared by all Storage calls (ignored for in-memory SQLite, which uses one connection)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
     # Optional LLM: empty = rules-only (no LLM). e.g. "openai", "anthropic"
     llm_provider: str = ""
     llm_api_key: str = ""
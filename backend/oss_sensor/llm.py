@@ -1,8 +1,12 @@
 """Optional LLM provider: pluggable; when unset, pipeline runs rules-only."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
+from pydantic import BaseModel
+
 from oss_sensor.config import Settings
 from oss_sensor.models import (
     EvidenceBundle,
@@ -66,6 +70,77 @@ class LLMProvider(ABC):
         """Optional: add recommendations. Default returns base."""
         return base
 
+    # Async variants: the report pipeline awaits these so enrichments for a diff overlap.
+    # Defaults run the sync method in a worker thread; providers with async SDK clients override.
+
+    async def aenrich_triage(
+        self,
+        diff_id: str,
+        score_result: ScoreResult,
+        evidence_bundle: EvidenceBundle,
+        base_report: TriageReport,
+    ) -> TriageReport:
+        return await asyncio.to_thread(
+            self.enrich_triage, diff_id, score_result, evidence_bundle, base_report
+        )
+
+    async def aenrich_fuzz_plan(
+        self,
+        diff_id: str,
+        evidence_bundle: EvidenceBundle,
+        base_plan: FuzzPlan,
+    ) -> FuzzPlan:
+        return await asyncio.to_thread(self.enrich_fuzz_plan, diff_id, evidence_bundle, base_plan)
+
+    async def aenrich_reverse_context(
+        self,
+        diff_id: str,
+        evidence_bundle: EvidenceBundle,
+        base_report: ReverseContextReport,
+    ) -> ReverseContextReport:
+        return await asyncio.to_thread(
+            self.enrich_reverse_context, diff_id, evidence_bundle, base_report
+        )
+
+    async def aenrich_hypotheses(
+        self,
+        diff_id: str,
+        evidence_bundle: EvidenceBundle,
+        base: VulnHypotheses,
+    ) -> VulnHypotheses:
+        return await asyncio.to_thread(self.enrich_hypotheses, diff_id, evidence_bundle, base)
+
+    async def aenrich_telemetry(
+        self,
+        diff_id: str,
+        evidence_bundle: EvidenceBundle,
+        base: TelemetryRecommendations,
+    ) -> TelemetryRecommendations:
+        return await asyncio.to_thread(self.enrich_telemetry, diff_id, evidence_bundle, base)
+
+    async def aenrich_all(
+        self,
+        diff_id: str,
+        score_result: ScoreResult,
+        evidence_bundle: EvidenceBundle,
+        bases: dict[str, BaseModel],
+    ) -> dict[str, BaseModel]:
+        """
+        Enrich every base report for one diff; `bases` is keyed by report type
+        (triage, reverse_context, vuln_hypotheses, fuzz_plan, telemetry).
+        Default fans out to the per-report methods concurrently. A provider that can
+        answer all five from one combined request overrides this to save round-trips.
+        """
+        per_report = {
+            "triage": lambda b: self.aenrich_triage(diff_id, score_result, evidence_bundle, b),
+            "reverse_context": lambda b: self.aenrich_reverse_context(diff_id, evidence_bundle, b),
+            "vuln_hypotheses": lambda b: self.aenrich_hypotheses(diff_id, evidence_bundle, b),
+            "fuzz_plan": lambda b: self.aenrich_fuzz_plan(diff_id, evidence_bundle, b),
+            "telemetry": lambda b: self.aenrich_telemetry(diff_id, evidence_bundle, b),
+        }
+        enriched = await asyncio.gather(*(per_report[k](b) for k, b in bases.items()))
+        return dict(zip(bases, enriched))
+
 
 class NoOpLLM(LLMProvider):
     """No LLM: return base reports unchanged (rules-only)."""
@@ -87,11 +162,26 @@ class NoOpLLM(LLMProvider):
     ) -> FuzzPlan:
         return base_plan
 
+    async def aenrich_all(
+        self,
+        diff_id: str,
+        score_result: ScoreResult,
+        evidence_bundle: EvidenceBundle,
+        bases: dict[str, BaseModel],
+    ) -> dict[str, BaseModel]:
+        # Nothing to enrich: hand back the base reports without a thread hop per report.
+        return bases
 
-def get_llm_provider(settings: Settings | None = None) -> LLMProvider:
-    """Return configured LLM provider or NoOp (rules-only)."""
-    s = settings or Settings()
-    if not s.llm_provider or not s.llm_api_key:
+
+@lru_cache(maxsize=8)
+def _provider_for(llm_provider: str, llm_model: str, llm_api_key: str) -> LLMProvider:
+    if not llm_provider or not llm_api_key:
         return NoOpLLM()
     # Pluggable: could load openai, anthropic, etc.
     return NoOpLLM()
+
+
+def get_llm_provider(settings: Settings | None = None) -> LLMProvider:
+    """Return configured LLM provider or NoOp (rules-only); one shared instance per configuration."""
+    s = settings or Settings()
+    return _provider_for(s.llm_provider, s.llm_model, s.llm_api_key)
@@ -1,14 +1,21 @@
 """FastAPI app: queue, diff, triage, artifacts, reports."""
 
+import asyncio
+import json
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from oss_sensor.config import Settings
 from oss_sensor.storage import Storage
-from oss_sensor.models import TriageState, EvidenceBundle, ScoreResult
+from oss_sensor.models import ArtifactMeta, EvidenceBundle, TriageState
+
+# Body for a diff row stored without an evidence bundle.
+_EMPTY_BUNDLE_JSON = EvidenceBundle().model_dump_json()
+# Valid triage state strings -> enum member; one dict lookup validates and converts request params.
+_TRIAGE_STATES = {s.value: s for s in TriageState}
 
 
 @asynccontextmanager
@@ -17,8 +24,7 @@ async def lifespan(app: FastAPI):
     app.state.storage = Storage(app.state.settings)
     await app.state.storage.init_db()
     yield
-    # shutdown if needed
-    pass
+    await app.state.storage.close()
 
 
 app = FastAPI(
@@ -48,38 +54,47 @@ async def get_queue(
     min_score: float | None = None,
     build_from: str | None = None,
     build_to: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
 ) -> list[dict[str, Any]]:
-    """Ranked queue with optional filters."""
+    """Ranked queue with optional filters; `limit` returns only the top entries."""
     storage: Storage = app.state.storage
-    triage_state = TriageState(state) if state else None
+    triage_state = None
+    if state:
+        triage_state = _TRIAGE_STATES.get(state)
+        if triage_state is None:
+            raise HTTPException(status_code=400, detail=f"Invalid state: {state}")
     return await storage.get_queue(
         component=component,
         state=triage_state,
         min_score=min_score,
         build_from=build_from,
         build_to=build_to,
+        limit=limit,
     )
 
 
 @app.get("/diff/{diff_id}")
-async def get_diff(diff_id: int) -> dict[str, Any]:
+async def get_diff(diff_id: int) -> Response:
     """Full diff detail: evidence bundle, score, state, notes."""
     storage: Storage = app.state.storage
     row = await storage.get_diff(diff_id)
     if not row:
         raise HTTPException(status_code=404, detail="Diff not found")
-    evidence = EvidenceBundle.model_validate_json(row.evidence_bundle_json) if row.evidence_bundle_json else EvidenceBundle()
-    score_result = ScoreResult.model_validate_json(row.score_result_json) if row.score_result_json else None
-    return {
+    # Both blobs were written by model_dump_json and are already valid JSON of the right shape:
+    # splice them into the body as-is rather than decoding them only to encode them again.
+    head = json.dumps({
         "id": str(row.id),
         "build_from": row.build_from,
         "build_to": row.build_to,
         "component": row.component,
-        "evidence_bundle": evidence.model_dump(),
-        "score_result": score_result.model_dump() if score_result else None,
         "state": row.state or TriageState.PENDING.value,
         "notes": row.notes or "",
-    }
+    })
+    body = (
+        f'{head[:-1]},"evidence_bundle":{row.evidence_bundle_json or _EMPTY_BUNDLE_JSON}'
+        f',"score_result":{row.score_result_json or "null"}}}'
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/diff/{diff_id}/triage")
@@ -90,9 +105,8 @@ async def update_triage(
 ) -> dict[str, str]:
     """Update triage state and notes."""
     storage: Storage = app.state.storage
-    try:
-        triage_state = TriageState(state)
-    except ValueError:
+    triage_state = _TRIAGE_STATES.get(state)
+    if triage_state is None:
         raise HTTPException(status_code=400, detail=f"Invalid state: {state}")
     ok = await storage.update_diff_triage(diff_id, triage_state, notes)
     if not ok:
@@ -101,20 +115,21 @@ async def update_triage(
 
 
 @app.get("/artifacts/{artifact_id}")
-async def get_artifact(artifact_id: str) -> dict[str, Any]:
+async def get_artifact(artifact_id: str) -> ArtifactMeta:
     """Artifact metadata (and optional content path when full_source_internal)."""
     storage: Storage = app.state.storage
     meta = await storage.get_artifact(artifact_id)
     if not meta:
         raise HTTPException(status_code=404, detail="Artifact not found")
-    return meta.model_dump()
+    return meta
 
 
 @app.get("/reports/{diff_id}")
 async def get_reports(diff_id: int) -> dict[str, Any]:
     """All reports for a diff: triage, reverse_context, vuln_hypotheses, fuzz_plan, telemetry."""
     storage: Storage = app.state.storage
-    row = await storage.get_diff(diff_id)
+    # Independent queries: check the diff exists while its reports are fetched.
+    row, reports = await asyncio.gather(storage.get_diff(diff_id), storage.get_reports(diff_id))
     if not row:
         raise HTTPException(status_code=404, detail="Diff not found")
-    return await storage.get_reports(diff_id)
+    return reports
@@ -1,6 +1,7 @@
 """Report generators: Triage, ReverseContext, VulnHypotheses, FuzzPlan, Telemetry (rules + optional LLM)."""
 
 from oss_sensor.reports.generator import (
+    evidence_refs_from_bundle,
     generate_triage_report,
     generate_reverse_context_report,
     generate_vuln_hypotheses,
@@ -9,6 +10,7 @@ from oss_sensor.reports.generator import (
 )
 
 __all__ = [
+    "evidence_refs_from_bundle",
     "generate_triage_report",
     "generate_reverse_context_report",
     "generate_vuln_hypotheses",
@@ -1,5 +1,6 @@
 """Generate all report types from evidence; rules-only by default, optional LLM when configured."""
 
+import itertools
 from datetime import datetime
 from typing import Any
 
@@ -18,15 +19,37 @@ from oss_sensor.models import (
 )
 
 
-def _evidence_refs_from_bundle(bundle: EvidenceBundle) -> list[EvidenceRef]:
+# Most evidence refs any report cites (reverse context; the fuzz plan cites the first 15).
+MAX_EVIDENCE_REFS = 30
+
+
+def evidence_refs_from_bundle(
+    bundle: EvidenceBundle, limit: int | None = MAX_EVIDENCE_REFS
+) -> list[EvidenceRef]:
+    """Citable refs in bundle order, deduplicated on (ref_type, stable_id); the first `limit` only.
+    Compute once per bundle and pass as `refs` to the generators that cite it.
+    """
+    # From/to builds share most strings, imports and symbols; key on (ref_type, stable_id) so each is
+    # cited once.
+    keys = itertools.chain(
+        (("diff_hunk", h.hunk_id) for h in bundle.diff_hunks),
+        (
+            ("string", b.value[:64])
+            for b in itertools.chain(bundle.binary_features_from, bundle.binary_features_to)
+            if isinstance(b.value, str)
+        ),
+        (("log_template", t.template_id) for t in bundle.log_templates),
+    )
     refs: list[EvidenceRef] = []
-    for h in bundle.diff_hunks:
-        refs.append(EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=h.hunk_id))
-    for s in bundle.binary_features_from + bundle.binary_features_to:
-        if isinstance(s.value, str):
-            refs.append(EvidenceRef(ref_type="string", artifact_id=None, stable_id=s.value[:64]))
-    for t in bundle.log_templates:
-        refs.append(EvidenceRef(ref_type="log_template", artifact_id=None, stable_id=t.template_id))
+    seen: set[tuple[str, str]] = set()
+    for ref_type, stable_id in keys:
+        if limit is not None and len(refs) >= limit:
+            break  # the rest of the bundle is never walked
+        if (ref_type, stable_id) not in seen:
+            seen.add((ref_type, stable_id))
+            refs.append(
+                EvidenceRef.model_construct(ref_type=ref_type, artifact_id=None, stable_id=stable_id)
+            )
     return refs
 
 
@@ -42,9 +65,10 @@ def generate_triage_report(
     for r in score_result.reasons:
         citations.extend(r.evidence_refs)
     summary = f"Score {score_result.total_score} from {len(score_result.reasons)} reasons."
+    # Evidence ids render as a list literal, e.g. "(evidence: ['a1b2'])", joined straight from the refs.
     score_explanation = " ".join(
-        f"[{i+1}] {reasons.reason} (evidence: {[e.stable_id for e in reasons.evidence_refs]})"
-        for i, reasons in enumerate(score_result.reasons)
+        f"[{i}] {r.reason} (evidence: [{', '.join(repr(e.stable_id) for e in r.evidence_refs)}])"
+        for i, r in enumerate(score_result.reasons, 1)
     )
     return TriageReport(
         diff_id=diff_id,
@@ -58,11 +82,12 @@ def generate_reverse_context_report(
     diff_id: str,
     evidence_bundle: EvidenceBundle,
     settings: Settings | None = None,
+    refs: list[EvidenceRef] | None = None,
 ) -> ReverseContextReport:
     """Map binary evidence to source chunks; anchor strings and entry points from evidence."""
     settings = settings or Settings()
     anchor_strings: list[str] = []
-    for b in evidence_bundle.binary_features_from + evidence_bundle.binary_features_to:
+    for b in itertools.chain(evidence_bundle.binary_features_from, evidence_bundle.binary_features_to):
         if b.feature_type == "strings" and isinstance(b.value, str) and len(b.value) > 8:
             anchor_strings.append(b.value[:80])
     probable_entry_points = [
@@ -76,17 +101,39 @@ def generate_reverse_context_report(
             "lines": (h.old_start, h.old_start + h.old_count),
             "snippet": "\n".join(h.lines[:15]),
         })
-    refs = _evidence_refs_from_bundle(evidence_bundle)
+    if refs is None:
+        refs = evidence_refs_from_bundle(evidence_bundle)
     return ReverseContextReport(
         diff_id=diff_id,
         anchor_strings=anchor_strings[:20],
         probable_entry_points=probable_entry_points,
         oss_context_snippets=oss_snippets,
         call_path_hints=[],
-        evidence_refs=refs[:30],
+        evidence_refs=refs[:MAX_EVIDENCE_REFS],
     )
 
 
+# (statement, test_approach) per source feature type; other feature types yield no hypothesis.
+HYPOTHESIS_TEMPLATES: dict[str, tuple[str, str]] = {
+    "alloc_math": (
+        "Size derived from external input may influence allocation; check for integer overflow.",
+        "Trace allocation size from input; fuzz with large/small counts.",
+    ),
+    "bounds_check": (
+        "Bounds check added or removed; prior OOB read/write possible.",
+        "Compare with/without check; fuzz boundary values.",
+    ),
+    "parsing": (
+        "Parsing/deserialization change; malformed input may reach new code paths.",
+        "Structure-aware fuzzing; capture valid messages as seeds.",
+    ),
+    "privilege_check": (
+        "Privilege/entitlement gate moved or added; check for TOCTOU or bypass.",
+        "Trace entitlement checks; test with reduced privileges.",
+    ),
+}
+
+
 def generate_vuln_hypotheses(
     diff_id: str,
     evidence_bundle: EvidenceBundle,
@@ -95,40 +142,15 @@ def generate_vuln_hypotheses(
 ) -> VulnHypotheses:
     """Produce testable hypotheses from features (no exploit chains)."""
     settings = settings or Settings()
-    hypotheses: list[VulnHypothesis] = []
-    for sf in evidence_bundle.source_features:
-        if sf.feature_type == "alloc_math":
-            hypotheses.append(
-                VulnHypothesis(
-                    statement="Size derived from external input may influence allocation; check for integer overflow.",
-                    evidence_refs=[EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)],
-                    test_approach="Trace allocation size from input; fuzz with large/small counts.",
-                )
-            )
-        elif sf.feature_type == "bounds_check":
-            hypotheses.append(
-                VulnHypothesis(
-                    statement="Bounds check added or removed; prior OOB read/write possible.",
-                    evidence_refs=[EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)],
-                    test_approach="Compare with/without check; fuzz boundary values.",
-                )
-            )
-        elif sf.feature_type == "parsing":
-            hypotheses.append(
-                VulnHypothesis(
-                    statement="Parsing/deserialization change; malformed input may reach new code paths.",
-                    evidence_refs=[EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)],
-                    test_approach="Structure-aware fuzzing; capture valid messages as seeds.",
-                )
-            )
-        elif sf.feature_type == "privilege_check":
-            hypotheses.append(
-                VulnHypothesis(
-                    statement="Privilege/entitlement gate moved or added; check for TOCTOU or bypass.",
-                    evidence_refs=[EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)],
-                    test_approach="Trace entitlement checks; test with reduced privileges.",
-                )
-            )
+    hypotheses = [
+        VulnHypothesis.model_construct(
+            statement=tpl[0],
+            evidence_refs=[EvidenceRef.model_construct(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)],
+            test_approach=tpl[1],
+        )
+        for sf in evidence_bundle.source_features
+        if (tpl := HYPOTHESIS_TEMPLATES.get(sf.feature_type)) is not None
+    ]
     return VulnHypotheses(
         diff_id=diff_id,
         hypotheses=hypotheses,
@@ -139,6 +161,7 @@ def generate_fuzz_plan(
     diff_id: str,
     evidence_bundle: EvidenceBundle,
     settings: Settings | None = None,
+    refs: list[EvidenceRef] | None = None,
 ) -> FuzzPlan:
     """Output fuzz plan: target surface, harness sketch, seed strategy, success metrics."""
     settings = settings or Settings()
@@ -157,7 +180,8 @@ def generate_fuzz_plan(
         "Sanitizer signals (ASan, UBSan) where applicable",
         "Coverage deltas on changed functions",
     ]
-    refs = _evidence_refs_from_bundle(evidence_bundle)[:15]
+    if refs is None:
+        refs = evidence_refs_from_bundle(evidence_bundle)
     return FuzzPlan(
         diff_id=diff_id,
         target_surface=target,
@@ -165,7 +189,7 @@ def generate_fuzz_plan(
         input_model=input_model,
         seed_strategy=seed_strategy,
         success_metrics=success_metrics,
-        evidence_refs=refs,
+        evidence_refs=refs[:15],
     )
 
 
@@ -183,7 +207,9 @@ def generate_telemetry_recommendations(
                 recommendation=f"Monitor for log template: {t.format_string[:80]}",
                 subsystem_category=f"{t.subsystem}/{t.category}",
                 correlation="Correlate with process ancestry and entitlements when this template appears.",
-                evidence_refs=[EvidenceRef(ref_type="log_template", artifact_id=None, stable_id=t.template_id)],
+                evidence_refs=[
+                    EvidenceRef.model_construct(ref_type="log_template", artifact_id=None, stable_id=t.template_id)
+                ],
             )
         )
     if evidence_bundle.log_to_binary_matches:
@@ -193,7 +219,7 @@ def generate_telemetry_recommendations(
                 subsystem_category="xpc",
                 correlation="Log–binary correlation suggests entry point; enrich with entitlements.",
                 evidence_refs=[
-                    EvidenceRef(ref_type="log_template", artifact_id=None, stable_id=tpl_id)
+                    EvidenceRef.model_construct(ref_type="log_template", artifact_id=None, stable_id=tpl_id)
                     for tpl_id, _ in evidence_bundle.log_to_binary_matches[:5]
                 ],
             )
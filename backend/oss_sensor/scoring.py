@@ -1,5 +1,7 @@
 """Scoring engine: total score + reasons with evidence_refs (deterministic, reproducible)."""
 
+import math
+
 from oss_sensor.models import (
     EvidenceBundle,
     EvidenceRef,
@@ -21,6 +23,15 @@ WEIGHTS = {
 }
 
 
+def _reason(reason: str, weight: float, ref_type: str, stable_id: str) -> Reason:
+    # Fields come from an already-validated bundle; skip re-validating each Reason/EvidenceRef.
+    return Reason.model_construct(
+        reason=reason,
+        score_contribution=weight,
+        evidence_refs=[EvidenceRef.model_construct(ref_type=ref_type, artifact_id=None, stable_id=stable_id)],
+    )
+
+
 def score_diff(
     diff_id: str,
     evidence_bundle: EvidenceBundle,
@@ -30,57 +41,38 @@ def score_diff(
     Every reason cites evidence_refs (artifact IDs / stable IDs).
     Deterministic and reproducible.
     """
-    total = 0.0
-    reasons: list[Reason] = []
+    weight = WEIGHTS.get
+    w_symbols = weight("binary_symbols_changed", 1.0)
+    w_correlation = weight("log_binary_correlation", 1.2)
 
     # Source features
-    for sf in evidence_bundle.source_features:
-        w = WEIGHTS.get(sf.feature_type, 1.0)
-        total += w
-        reasons.append(
-            Reason(
-                reason=f"Source feature: {sf.feature_type} in {sf.file_path}",
-                score_contribution=w,
-                evidence_refs=[
-                    EvidenceRef(ref_type="diff_hunk", artifact_id=None, stable_id=sf.hunk_id)
-                ],
-            )
+    reasons = [
+        _reason(
+            f"Source feature: {sf.feature_type} in {sf.file_path}",
+            weight(sf.feature_type, 1.0),
+            "diff_hunk",
+            sf.hunk_id,
         )
-
+        for sf in evidence_bundle.source_features
+    ]
     # Binary diff pairs (symbol/function changes)
-    for bd in evidence_bundle.binary_diff_pairs:
-        w = WEIGHTS.get("binary_symbols_changed", 1.0)
-        total += w
-        reasons.append(
-            Reason(
-                reason=f"Binary symbol change: {bd.from_function} -> {bd.to_function}",
-                score_contribution=w,
-                evidence_refs=[
-                    EvidenceRef(
-                        ref_type="binary_function",
-                        artifact_id=None,
-                        stable_id=bd.to_function or bd.from_function,
-                    )
-                ],
-            )
+    reasons += [
+        _reason(
+            f"Binary symbol change: {bd.from_function} -> {bd.to_function}",
+            w_symbols,
+            "binary_function",
+            bd.to_function or bd.from_function,
         )
-
+        for bd in evidence_bundle.binary_diff_pairs
+    ]
     # Log–binary correlation
-    for tpl_id, _ in evidence_bundle.log_to_binary_matches:
-        w = WEIGHTS.get("log_binary_correlation", 1.2)
-        total += w
-        reasons.append(
-            Reason(
-                reason=f"Log template correlated to binary: {tpl_id}",
-                score_contribution=w,
-                evidence_refs=[
-                    EvidenceRef(ref_type="log_template", artifact_id=None, stable_id=tpl_id)
-                ],
-            )
-        )
+    reasons += [
+        _reason(f"Log template correlated to binary: {tpl_id}", w_correlation, "log_template", tpl_id)
+        for tpl_id, _ in evidence_bundle.log_to_binary_matches
+    ]
 
     return ScoreResult(
-        total_score=round(total, 2),
+        total_score=round(math.fsum(r.score_contribution for r in reasons), 2),
         reasons=reasons,
         diff_id=diff_id,
     )
@@ -1,14 +1,25 @@
 """License-aware storage: artifacts, diffs, evidence, queue, reports."""
 
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
-import json
 import uuid
 
-from sqlalchemy import Column, String, Float, DateTime, Text, Integer
+import orjson
+from pydantic import BaseModel
+from sqlalchemy import Column, String, Float, DateTime, Text, Integer, Index, Select, event, exists, func, insert, inspect, literal, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Result, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.sql.dml import Insert, ReturningInsert
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.functions import FunctionElement
 
 from oss_sensor.config import Settings, StorageMode
 from oss_sensor.models import (
@@ -26,48 +37,99 @@ from oss_sensor.models import (
 
 Base = declarative_base()
 
+# Decoded report sets kept per Storage instance (see Storage.get_reports).
+REPORTS_CACHE_SIZE = 256
+
+# Stored kind string -> enum member, so rows convert with a dict lookup rather than ArtifactKind(...).
+_ARTIFACT_KINDS = {k.value: k for k in ArtifactKind}
+
+# Applied to every new SQLite connection. WAL lets readers proceed during a write and makes
+# synchronous=NORMAL safe (no fsync per commit); the rest are per-connection cache/lock settings.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=10000",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 def _json_serial(obj: Any) -> Any:
-    if isinstance(obj, datetime):
-        return obj.isoformat()
+    # orjson encodes datetimes natively; only models need converting.
     if hasattr(obj, "model_dump"):
         return obj.model_dump()
     raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
 
+class UtcNow(FunctionElement):
+    """Current UTC timestamp as a column default; datetime columns here store naive UTC."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _utc_now_default(element: UtcNow, compiler: Any, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"  # UTC on SQLite
+
+
+@compiles(UtcNow, "postgresql")
+def _utc_now_postgresql(element: UtcNow, compiler: Any, **kw: Any) -> str:
+    # now() is in the session time zone; convert so naive timestamps stay UTC.
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 # --- Tables ---
 
 
 class BuildRow(Base):
     __tablename__ = "builds"
     id = Column(String(64), primary_key=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UtcNow())
 
 
 class ArtifactRow(Base):
     __tablename__ = "artifacts"
     id = Column(String(64), primary_key=True)
-    build_id = Column(String(64), nullable=False, index=True)
+    build_id = Column(String(64), nullable=False)
     component = Column(String(128), nullable=False, index=True)
     kind = Column(String(32), nullable=False)  # source, binary, log
     path = Column(Text, nullable=False)
-    ingested_at = Column(DateTime, default=datetime.utcnow)
+    ingested_at = Column(DateTime, server_default=UtcNow())
     # Derived features only (always stored); full content only when storage_mode allows
     features_json = Column(Text, nullable=True)  # JSON of extracted features
     content_path = Column(Text, nullable=True)  # optional path to full content in full_source_internal
 
+    # list_artifacts filters on build_id, then component and kind (see `diff`).
+    __table_args__ = (Index("ix_art_build_comp_kind", "build_id", "component", "kind"),)
+
 
 class DiffRow(Base):
     __tablename__ = "diffs"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    build_from = Column(String(64), nullable=False, index=True)
+    build_from = Column(String(64), nullable=False)
     build_to = Column(String(64), nullable=False, index=True)
     component = Column(String(128), nullable=False, index=True)
     evidence_bundle_json = Column(Text, nullable=True)
     score_result_json = Column(Text, nullable=True)
+    total_score = Column(Float, nullable=True, index=True)  # copy of score_result_json's total_score, for ranking in SQL
     state = Column(String(32), default=TriageState.PENDING.value)
     notes = Column(Text, default="")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UtcNow())
+
+    # Queue filters: triage state ranked by score, and a build pair narrowed to one component.
+    __table_args__ = (
+        Index("ix_diff_state_score", "state", "total_score"),
+        Index("ix_diff_bf_bt_comp", "build_from", "build_to", "component"),
+    )
 
 
 class ReportRow(Base):
@@ -76,7 +138,69 @@ class ReportRow(Base):
     diff_id = Column(Integer, nullable=False, index=True)
     report_type = Column(String(64), nullable=False)  # triage, reverse_context, vuln_hypotheses, fuzz_plan, telemetry
     payload_json = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=UtcNow())
+
+
+# Write statements built once; SQLAlchemy caches their compiled SQL and Core skips the ORM unit of work.
+_ARTIFACT_INS = insert(ArtifactRow)  # artifact ids are generated client-side, nothing to return
+_DIFF_INS: ReturningInsert = insert(DiffRow).returning(DiffRow.id)
+_REPORT_INS: ReturningInsert = insert(ReportRow).returning(
+    ReportRow.id, sort_by_parameter_order=True
+)
+
+# Rows fetched per batch when list queries stream their results.
+_STREAM_BATCH = 500
+
+# Single-column indexes now covered as the leading column of a composite index.
+_SUPERSEDED_INDEXES = ("ix_artifacts_build_id", "ix_diffs_build_from")
+
+
+def _build_upsert(dialect_name: str, build_id: str) -> Insert:
+    """INSERT of a build row that is a no-op when the build already exists."""
+    if dialect_name in ("postgresql", "sqlite"):
+        dialect_insert = postgresql_insert if dialect_name == "postgresql" else sqlite_insert
+        return dialect_insert(BuildRow).values(id=build_id).on_conflict_do_nothing(index_elements=["id"])
+    # No ON CONFLICT clause elsewhere: INSERT ... SELECT, which selects nothing once the row exists.
+    missing = select(literal(build_id)).where(~exists().where(BuildRow.id == build_id))
+    return insert(BuildRow).from_select(["id"], missing)
+
+
+def _add_total_score_column(connection: Connection) -> None:
+    """Databases created before diffs.total_score existed: add the column and fill it from the JSON."""
+    if "total_score" in {c["name"] for c in inspect(connection).get_columns("diffs")}:
+        return
+    connection.execute(text("ALTER TABLE diffs ADD COLUMN total_score FLOAT"))
+    scored: Select = select(DiffRow.id, DiffRow.score_result_json).where(DiffRow.score_result_json.is_not(None))
+    for diff_id, score_json in connection.execute(scored).all():
+        connection.execute(
+            update(DiffRow)
+            .where(DiffRow.id == diff_id)
+            .values(total_score=orjson.loads(score_json)["total_score"])
+        )
+
+
+def _add_timestamp_defaults(connection: Connection) -> None:
+    """Tables created when timestamps were filled in Python have no column default: give them one."""
+    inspector = inspect(connection)
+    sqlite = connection.dialect.name == "sqlite"
+    now_sql = str(UtcNow().compile(dialect=connection.dialect))
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"]: c for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.server_default is None or existing[column.name]["default"] is not None:
+                continue
+            if sqlite:
+                # SQLite can't alter a column's default; fill it in right after the insert instead.
+                connection.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {table.name}_{column.name}_default"
+                    f" AFTER INSERT ON {table.name} WHEN NEW.{column.name} IS NULL"
+                    f" BEGIN UPDATE {table.name} SET {column.name} = {now_sql}"
+                    f" WHERE rowid = NEW.rowid; END"
+                ))
+            else:
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ALTER COLUMN {column.name} SET DEFAULT {now_sql}"
+                ))
 
 
 # --- Storage service ---
@@ -87,14 +211,30 @@ class Storage:
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or Settings()
+        url = make_url(self.settings.database_url)
+        # In-memory SQLite (":memory:", an empty database, or mode=memory URIs) lives in a single
+        # static connection, which takes no sizing arguments.
+        in_memory = url.get_backend_name() == "sqlite" and (
+            url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+        )
+        pool_kwargs: dict[str, Any] = {"poolclass": StaticPool}
+        if not in_memory:
+            pool_kwargs = {
+                "pool_size": self.settings.db_pool_size,
+                "max_overflow": self.settings.db_max_overflow,
+            }
         self._engine = create_async_engine(
             self.settings.database_url,
             echo=False,
+            **pool_kwargs,
         )
+        if self.settings.database_url.startswith("sqlite"):
+            event.listen(self._engine.sync_engine, "connect", _apply_sqlite_pragmas)
         self._session_factory = async_sessionmaker(
             self._engine, class_=AsyncSession, expire_on_commit=False
         )
         self._init_done = False
+        self._reports_cache: OrderedDict[int, tuple[int, dict[str, Any]]] = OrderedDict()
 
     async def init_db(self) -> None:
         if self._init_done:
@@ -104,9 +244,27 @@ class Storage:
             data_path = Path("./data")
             data_path.mkdir(parents=True, exist_ok=True)
         async with self._engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+            if self._engine.dialect.name == "sqlite":
+                # Take the write lock up front: API workers starting together then run the
+                # schema checks and migrations below one at a time, each seeing the last one's result.
+                await conn.exec_driver_sql("BEGIN IMMEDIATE")
+            # IF NOT EXISTS rather than create_all's check-then-create, so several API workers
+            # starting against the same fresh database don't race each other.
+            for table in Base.metadata.sorted_tables:
+                await conn.execute(CreateTable(table, if_not_exists=True))
+            await conn.run_sync(_add_total_score_column)
+            await conn.run_sync(_add_timestamp_defaults)
+            for name in _SUPERSEDED_INDEXES:
+                await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    await conn.execute(CreateIndex(index, if_not_exists=True))
         self._init_done = True
 
+    async def close(self) -> None:
+        """Close pooled connections; call once on shutdown."""
+        await self._engine.dispose()
+
     def _session(self) -> AsyncSession:
         return self._session_factory()
 
@@ -114,11 +272,8 @@ class Storage:
 
     async def ensure_build(self, build_id: str) -> None:
         async with self._session() as session:
-            from sqlalchemy import select
-            r = await session.execute(select(BuildRow).where(BuildRow.id == build_id))
-            if r.scalar_one_or_none() is None:
-                session.add(BuildRow(id=build_id))
-                await session.commit()
+            await session.execute(_build_upsert(self._engine.dialect.name, build_id))
+            await session.commit()
 
     # --- Artifacts ---
 
@@ -133,50 +288,43 @@ class Storage:
     ) -> str:
         artifact_id = str(uuid.uuid4())
         async with self._session() as session:
-            await self.ensure_build(build_id)
+            # Materialize the build in the same transaction as the artifact.
+            await session.execute(_build_upsert(self._engine.dialect.name, build_id))
             store_content = (
                 self.settings.storage_mode == StorageMode.FULL_SOURCE_INTERNAL
                 and content_path is not None
             )
-            row = ArtifactRow(
-                id=artifact_id,
-                build_id=build_id,
-                component=component,
-                kind=kind.value,
-                path=path,
-                features_json=json.dumps(features_json, default=_json_serial),
-                content_path=content_path if store_content else None,
+            await session.execute(
+                _ARTIFACT_INS,
+                {
+                    "id": artifact_id,
+                    "build_id": build_id,
+                    "component": component,
+                    "kind": kind.value,
+                    "path": path,
+                    "features_json": orjson.dumps(features_json, default=_json_serial).decode(),
+                    "content_path": content_path if store_content else None,
+                },
             )
-            session.add(row)
             await session.commit()
         return artifact_id
 
     async def get_artifact(self, artifact_id: str) -> ArtifactMeta | None:
         async with self._session() as session:
-            from sqlalchemy import select
             r = await session.execute(select(ArtifactRow).where(ArtifactRow.id == artifact_id))
             row = r.scalar_one_or_none()
         if not row:
             return None
-        return ArtifactMeta(
-            artifact_id=row.id,
-            build_id=row.build_id,
-            component=row.component,
-            kind=ArtifactKind(row.kind),
-            path=row.path,
-            ingested_at=row.ingested_at or datetime.utcnow(),
-            storage_mode=self.settings.storage_mode.value,
-        )
+        return self._artifact_meta(row, self.settings.storage_mode.value)
 
     async def get_artifact_features(self, artifact_id: str) -> dict | list | None:
         """Return stored features JSON for an artifact."""
         async with self._session() as session:
-            from sqlalchemy import select
             r = await session.execute(select(ArtifactRow).where(ArtifactRow.id == artifact_id))
             row = r.scalar_one_or_none()
         if not row or not row.features_json:
             return None
-        return json.loads(row.features_json)
+        return orjson.loads(row.features_json)
 
     async def list_artifacts(
         self,
@@ -185,7 +333,6 @@ class Storage:
         kind: ArtifactKind | None = None,
     ) -> list[ArtifactMeta]:
         async with self._session() as session:
-            from sqlalchemy import select
             q = select(ArtifactRow)
             if build_id:
                 q = q.where(ArtifactRow.build_id == build_id)
@@ -193,20 +340,22 @@ class Storage:
                 q = q.where(ArtifactRow.component == component)
             if kind:
                 q = q.where(ArtifactRow.kind == kind.value)
-            r = await session.execute(q)
-            rows = r.scalars().all()
-        return [
-            ArtifactMeta(
-                artifact_id=row.id,
-                build_id=row.build_id,
-                component=row.component,
-                kind=ArtifactKind(row.kind),
-                path=row.path,
-                ingested_at=row.ingested_at or datetime.utcnow(),
-                storage_mode=self.settings.storage_mode.value,
-            )
-            for row in rows
-        ]
+            r = await session.stream(q.execution_options(yield_per=_STREAM_BATCH))
+            storage_mode = self.settings.storage_mode.value
+            return [self._artifact_meta(row, storage_mode) async for row in r.scalars()]
+
+    def _artifact_meta(self, row: ArtifactRow, storage_mode: str) -> ArtifactMeta:
+        # Rows are only written by store_artifact, so every field is already well-typed:
+        # build the model without running validation.
+        return ArtifactMeta.model_construct(
+            artifact_id=row.id,
+            build_id=row.build_id,
+            component=row.component,
+            kind=_ARTIFACT_KINDS[row.kind],
+            path=row.path,
+            ingested_at=row.ingested_at or datetime.utcnow(),
+            storage_mode=storage_mode,
+        )
 
     # --- Diffs ---
 
@@ -219,47 +368,59 @@ class Storage:
         score_result: ScoreResult | None = None,
     ) -> int:
         async with self._session() as session:
-            row = DiffRow(
-                build_from=build_from,
-                build_to=build_to,
-                component=component,
-                evidence_bundle_json=evidence_bundle.model_dump_json(),
-                score_result_json=score_result.model_dump_json() if score_result else None,
+            r = await session.execute(
+                _DIFF_INS,
+                {
+                    "build_from": build_from,
+                    "build_to": build_to,
+                    "component": component,
+                    "evidence_bundle_json": evidence_bundle.model_dump_json(),
+                    "score_result_json": score_result.model_dump_json() if score_result else None,
+                    "total_score": score_result.total_score if score_result else None,
+                },
             )
-            session.add(row)
+            diff_id = int(r.scalar_one())
             await session.commit()
-            await session.refresh(row)
-            return int(row.id)
+            return diff_id
 
     async def get_diff(self, diff_id: int) -> DiffRow | None:
         async with self._session() as session:
-            from sqlalchemy import select
             r = await session.execute(select(DiffRow).where(DiffRow.id == diff_id))
             return r.scalar_one_or_none()
 
+    def evidence_bundle(self, row: DiffRow) -> EvidenceBundle:
+        """Parsed evidence bundle for a diff row (empty when none was stored)."""
+        if not row.evidence_bundle_json:
+            return EvidenceBundle()
+        return EvidenceBundle.model_validate_json(row.evidence_bundle_json)
+
     async def update_diff_triage(self, diff_id: int, state: TriageState, notes: str = "") -> bool:
         async with self._session() as session:
-            from sqlalchemy import select, update
-            r = await session.execute(select(DiffRow).where(DiffRow.id == diff_id))
-            row = r.scalar_one_or_none()
-            if not row:
-                return False
-            await session.execute(
-                update(DiffRow).where(DiffRow.id == diff_id).values(state=state.value, notes=notes)
+            # One statement: RETURNING tells us whether the diff existed.
+            r: Result = await session.execute(
+                update(DiffRow)
+                .where(DiffRow.id == diff_id)
+                .values(state=state.value, notes=notes)
+                .returning(DiffRow.id)
             )
+            found = r.scalar_one_or_none() is not None
             await session.commit()
-            return True
+            return found
 
     async def set_diff_score(self, diff_id: int, score_result: ScoreResult) -> bool:
         async with self._session() as session:
-            from sqlalchemy import update
-            await session.execute(
+            r: Result = await session.execute(
                 update(DiffRow)
                 .where(DiffRow.id == diff_id)
-                .values(score_result_json=score_result.model_dump_json())
+                .values(
+                    score_result_json=score_result.model_dump_json(),
+                    total_score=score_result.total_score,
+                )
+                .returning(DiffRow.id)
             )
+            found = r.scalar_one_or_none() is not None
             await session.commit()
-            return True
+            return found
 
     async def list_diffs(
         self,
@@ -269,7 +430,6 @@ class Storage:
         state: TriageState | None = None,
     ) -> list[DiffRow]:
         async with self._session() as session:
-            from sqlalchemy import select
             q = select(DiffRow)
             if build_from:
                 q = q.where(DiffRow.build_from == build_from)
@@ -280,8 +440,8 @@ class Storage:
             if state:
                 q = q.where(DiffRow.state == state.value)
             q = q.order_by(DiffRow.id.desc())
-            r = await session.execute(q)
-            return list(r.scalars().all())
+            r = await session.stream(q.execution_options(yield_per=_STREAM_BATCH))
+            return [row async for row in r.scalars()]
 
     # --- Queue (ranked) ---
 
@@ -292,34 +452,53 @@ class Storage:
         min_score: float | None = None,
         build_from: str | None = None,
         build_to: str | None = None,
+        limit: int | None = None,
     ) -> list[dict[str, Any]]:
-        rows = await self.list_diffs(
-            build_from=build_from,
-            build_to=build_to,
-            component=component,
-            state=state,
-        )
-        out: list[dict[str, Any]] = []
-        for row in rows:
-            score = 0.0
-            if row.score_result_json:
-                sr = ScoreResult.model_validate_json(row.score_result_json)
-                score = sr.total_score
-            if min_score is not None and score < min_score:
-                continue
-            out.append({
-                "id": str(row.id),
-                "diff_id": str(row.id),
-                "build_from": row.build_from,
-                "build_to": row.build_to,
-                "component": row.component,
-                "score": score,
-                "state": row.state or TriageState.PENDING.value,
-                "notes": row.notes or "",
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-            })
-        out.sort(key=lambda x: (-x["score"], x["diff_id"]))
-        return out
+        # Filter and rank in SQL on the total_score column; the evidence/score JSON is never loaded.
+        # Conditions use the bare column so the score indexes apply. Unscored diffs (NULL) count as
+        # 0.0, so they rank alongside 0.0 diffs; ties go to the newest diff first.
+        total_score: ColumnElement[float | None] = DiffRow.total_score
+        score = func.coalesce(total_score, 0.0)
+        async with self._session() as session:
+            q: Select = select(
+                DiffRow.id,
+                DiffRow.build_from,
+                DiffRow.build_to,
+                DiffRow.component,
+                score,
+                DiffRow.state,
+                DiffRow.notes,
+                DiffRow.created_at,
+            )
+            if build_from:
+                q = q.where(DiffRow.build_from == build_from)
+            if build_to:
+                q = q.where(DiffRow.build_to == build_to)
+            if component:
+                q = q.where(DiffRow.component == component)
+            if state:
+                q = q.where(DiffRow.state == state.value)
+            if min_score is not None:
+                at_least = total_score >= min_score
+                q = q.where(or_(at_least, total_score.is_(None)) if min_score <= 0 else at_least)
+            q = q.order_by(score.desc(), DiffRow.id.desc())
+            if limit is not None:
+                q = q.limit(limit)
+            rows = await session.stream(q.execution_options(yield_per=_STREAM_BATCH))
+            return [
+                {
+                    "id": str(diff_id),
+                    "diff_id": str(diff_id),
+                    "build_from": bf,
+                    "build_to": bt,
+                    "component": comp,
+                    "score": total,
+                    "state": st or TriageState.PENDING.value,
+                    "notes": notes or "",
+                    "created_at": created_at.isoformat() if created_at else None,
+                }
+                async for diff_id, bf, bt, comp, total, st, notes, created_at in rows
+            ]
 
     # --- Reports ---
 
@@ -334,24 +513,55 @@ class Storage:
         | TelemetryRecommendations,
     ) -> int:
         async with self._session() as session:
-            row = ReportRow(
-                diff_id=diff_id,
-                report_type=report_type,
-                payload_json=payload.model_dump_json(),
+            r = await session.execute(
+                _REPORT_INS,
+                {"diff_id": diff_id, "report_type": report_type, "payload_json": payload.model_dump_json()},
             )
-            session.add(row)
+            report_id = int(r.scalar_one())
             await session.commit()
-            await session.refresh(row)
-            return int(row.id)
+        self._reports_cache.pop(diff_id, None)
+        return report_id
 
-    async def get_reports(self, diff_id: int) -> dict[str, Any]:
+    async def store_reports(self, diff_id: int, reports: dict[str, BaseModel]) -> list[int]:
+        """Store several reports for a diff (keyed by report_type) in one INSERT and one commit."""
+        if not reports:
+            return []
         async with self._session() as session:
-            from sqlalchemy import select
             r = await session.execute(
-                select(ReportRow).where(ReportRow.diff_id == diff_id).order_by(ReportRow.id)
+                _REPORT_INS,
+                [
+                    {"diff_id": diff_id, "report_type": report_type, "payload_json": payload.model_dump_json()}
+                    for report_type, payload in reports.items()
+                ],
+            )
+            ids = [int(i) for i in r.scalars().all()]
+            await session.commit()
+        self._reports_cache.pop(diff_id, None)
+        return ids
+
+    async def get_reports(self, diff_id: int) -> dict[str, Any]:
+        """Decoded reports for a diff keyed by type, LRU-cached by (diff_id, newest report id).
+        Report ids only grow, so a new report from any process changes the key. The returned
+        dict may be shared between callers; treat it as read-only.
+        """
+        async with self._session() as session:
+            latest: int | None = (
+                await session.execute(select(func.max(ReportRow.id)).where(ReportRow.diff_id == diff_id))
+            ).scalar_one()
+            cached = self._reports_cache.get(diff_id)
+            if cached is not None and cached[0] == latest:
+                self._reports_cache.move_to_end(diff_id)
+                return cached[1]
+            r: Result = await session.execute(
+                select(ReportRow.report_type, ReportRow.payload_json)
+                .where(ReportRow.diff_id == diff_id)
+                .order_by(ReportRow.id)
             )
-            rows = list(r.scalars().all())
-        result: dict[str, Any] = {}
-        for row in rows:
-            result[row.report_type] = json.loads(row.payload_json)
-        return result
+            rows = r.all()
+        # Later rows of the same type win, as reports are re-generated.
+        reports = {report_type: orjson.loads(payload_json) for report_type, payload_json in rows}
+        if latest is not None:
+            self._reports_cache[diff_id] = (latest, reports)
+            if len(self._reports_cache) > REPORTS_CACHE_SIZE:
+                self._reports_cache.popitem(last=False)
+        return reports
@@ -0,0 +1,147 @@
+"""Unit tests for deterministic analyzers: binary strings, source diff, log correlation."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from oss_sensor.analyzers.binary_features import _read_strings, extract_binary_features
+from oss_sensor.analyzers.log_correlation import correlate_log_to_binary, extract_log_templates
+from oss_sensor.analyzers.source_diff import _hunk_id, extract_source_features, parse_unified_hunks
+from oss_sensor.models import DiffHunk, LogTemplate
+
+
+def test_read_strings_printable_runs() -> None:
+    data = b"\xfe\xed\xfa\xcfshort\x00parse_buffer\x01\x02_malloc\x7fdefault subsystem"
+    assert _read_strings(data) == ["parse_buffer", "_malloc", "default subsystem"]
+    assert _read_strings(data, min_len=4) == ["short", "parse_buffer", "_malloc", "default subsystem"]
+    assert _read_strings(b"") == []
+
+
+def test_extract_binary_features_skips_non_macho(tmp_path: Path) -> None:
+    (tmp_path / "syslogd").write_bytes(b"\xfe\xed\xfa\xce\x00parse_buffer\x00")
+    (tmp_path / "notes.txt").write_bytes(b"not a mach-o binary")
+    (tmp_path / "empty").write_bytes(b"")
+    features = extract_binary_features(tmp_path)
+    assert features["strings"] == ["parse_buffer"]
+    assert "_main" in features["symbols"]
+
+
+def test_hunk_id_stable_and_distinct() -> None:
+    hid = _hunk_id("parser.c", 17, 17, ["+ if (count > 0)"])
+    assert len(hid) == 16
+    assert hid == _hunk_id("parser.c", 17, 17, ["+ if (count > 0)"])
+    ids = {_hunk_id("parser.c", n, n, ["+ if (count > 0)"]) for n in range(1000)}
+    assert len(ids) == 1000
+
+
+def test_parse_unified_hunks_insertion_and_replace(tmp_path: Path) -> None:
+    from_dir, to_dir = tmp_path / "b1", tmp_path / "b2"
+    from_dir.mkdir()
+    to_dir.mkdir()
+    (from_dir / "parser.c").write_text("a\nb\nc\n")
+    (to_dir / "parser.c").write_text("a\nB\nc\nd\ne\n")
+    hunks = parse_unified_hunks(from_dir, to_dir, [(from_dir / "parser.c", to_dir / "parser.c")])
+    assert [(h.old_start, h.old_count, h.new_start, h.new_count, h.lines) for h in hunks] == [
+        (2, 1, 2, 1, ["- b", "+ B"]),
+        (4, 0, 4, 2, ["+ d", "+ e"]),
+    ]
+    assert all(h.file_path == "parser.c" for h in hunks)
+    assert len({h.hunk_id for h in hunks}) == len(hunks)
+
+
+def test_extract_source_features_one_per_category() -> None:
+    hunk = DiffHunk(
+        file_path="parser.c",
+        old_start=17,
+        old_count=0,
+        new_start=17,
+        new_count=3,
+        lines=[
+            "+ if (count > 0 && (count * sizeof(struct entry)) / sizeof(struct entry) != count)",
+            "+     return NULL;",
+            "+ struct entry *entries = malloc(count * sizeof(struct entry));",
+        ],
+        hunk_id="h1",
+    )
+    features = extract_source_features([hunk])
+    assert [f.feature_type for f in features] == ["alloc_math", "bounds_check"]
+    assert all(f.hunk_id == "h1" and f.line_range == (17, 17) for f in features)
+
+
+def test_extract_log_templates_dedupes_lines_explained_by_template(tmp_path: Path) -> None:
+    (tmp_path / "system.log").write_text(
+        "syslogd started pid=%d\n"
+        "parser allocation overflow check failed count=%u\n"
+        "received message from client ok\n"
+    )
+    templates = extract_log_templates(tmp_path)
+    assert [t.format_string for t in templates] == [
+        "syslogd started pid=%@",
+        "parser allocation overflow check failed count=%@",
+        "received message from client ok",
+    ]
+    assert templates[1].sample_messages == ["parser allocation overflow check failed count=%u"]
+
+
+def test_extract_log_templates_dedupe_scales_with_many_lines(tmp_path: Path) -> None:
+    for f in range(8):
+        (tmp_path / f"worker{f}.log").write_text(
+            "".join(
+                f"worker {f} event {i} status=%d took %u ms\n"
+                if i % 2
+                else f"worker {f} plain event line number {i}\n"
+                for i in range(500)
+            )
+        )
+    start = time.perf_counter()
+    templates = extract_log_templates(tmp_path)
+    assert time.perf_counter() - start < 5.0
+    assert len(templates) == 100
+    assert len({t.format_string for t in templates}) == 100
+
+
+def test_extract_log_templates_ids_stable_across_processes(tmp_path: Path) -> None:
+    (tmp_path / "system.log").write_text("syslogd started pid=%d\n")
+    script = (
+        "import sys; from pathlib import Path; "
+        "from oss_sensor.analyzers.log_correlation import extract_log_templates; "
+        "print(extract_log_templates(Path(sys.argv[1]))[0].template_id)"
+    )
+    ids = {
+        subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path)],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert len(ids) == 1
+    assert ids.pop() == extract_log_templates(tmp_path)[0].template_id
+
+
+def test_correlate_log_to_binary_exact_and_substring() -> None:
+    templates = [
+        LogTemplate(
+            template_id="t_exact",
+            subsystem="default",
+            category="default",
+            format_string="parser allocation overflow check failed count=%u",
+        ),
+        LogTemplate(
+            template_id="t_sub",
+            subsystem="default",
+            category="default",
+            format_string="syslogd: parse_buffer returned NULL",
+        ),
+        LogTemplate(template_id="t_none", subsystem="default", category="default", format_string="unrelated"),
+    ]
+    binary_strings = ["_malloc", "parse_buffer", "parser allocation overflow check failed count=%u"]
+    assert correlate_log_to_binary(templates, binary_strings) == [
+        ("t_exact", "parser allocation overflow check failed count=%u"),
+        ("t_sub", "parse_buffer"),
+    ]
+    assert correlate_log_to_binary(templates, []) == []
@@ -0,0 +1,33 @@
+"""Unit tests for LLM provider selection and the default (rules-only) enrichment path."""
+
+from oss_sensor.config import Settings
+from oss_sensor.llm import LLMProvider, NoOpLLM, get_llm_provider
+from oss_sensor.models import EvidenceBundle, FuzzPlan, ScoreResult
+
+
+def test_get_llm_provider_shared_per_configuration() -> None:
+    llm = get_llm_provider(Settings(llm_provider="", llm_api_key=""))
+    assert isinstance(llm, NoOpLLM)
+    assert get_llm_provider(Settings(llm_provider="", llm_api_key="")) is llm
+    assert get_llm_provider(Settings(llm_provider="openai", llm_api_key="k")) is not llm
+
+
+async def test_aenrich_all_returns_every_report() -> None:
+    plan = FuzzPlan(
+        diff_id="1",
+        target_surface="t",
+        harness_sketch="h",
+        input_model="i",
+        seed_strategy="s",
+        success_metrics=[],
+        evidence_refs=[],
+    )
+    score = ScoreResult(total_score=0, reasons=[], diff_id="1")
+
+    class Echo(NoOpLLM):
+        aenrich_all = LLMProvider.aenrich_all  # default fan-out, not the NoOp short-circuit
+
+    for llm in (NoOpLLM(), Echo()):
+        out = await llm.aenrich_all("1", score, EvidenceBundle(), {"fuzz_plan": plan})
+        assert out == {"fuzz_plan": plan}
+        assert out["fuzz_plan"] is plan
@@ -0,0 +1,58 @@
+"""Unit tests for rules-based report generation."""
+
+from oss_sensor.models import BinaryFeature, DiffHunk, EvidenceBundle, LogTemplate
+from oss_sensor.reports.generator import (
+    evidence_refs_from_bundle,
+    generate_fuzz_plan,
+    generate_reverse_context_report,
+)
+
+
+def _bundle() -> EvidenceBundle:
+    shared = [
+        BinaryFeature(feature_type="imports", value="/usr/lib/libSystem.B.dylib"),
+        BinaryFeature(feature_type="strings", value="parse_buffer"),
+    ]
+    return EvidenceBundle(
+        diff_hunks=[
+            DiffHunk(file_path="parser.c", old_start=1, old_count=0, new_start=1, new_count=1, lines=["+ x"], hunk_id="h1"),
+        ],
+        binary_features_from=shared,
+        binary_features_to=shared + [BinaryFeature(feature_type="strings", value="check failed count=%u")],
+        log_templates=[
+            LogTemplate(template_id="t1", subsystem="default", category="default", format_string="ok"),
+        ],
+    )
+
+
+def test_evidence_refs_deduplicated_in_bundle_order() -> None:
+    refs = evidence_refs_from_bundle(_bundle())
+    assert [(r.ref_type, r.stable_id) for r in refs] == [
+        ("diff_hunk", "h1"),
+        ("string", "/usr/lib/libSystem.B.dylib"),
+        ("string", "parse_buffer"),
+        ("string", "check failed count=%u"),
+        ("log_template", "t1"),
+    ]
+    assert len(generate_fuzz_plan("1", _bundle()).evidence_refs) == 5
+    assert evidence_refs_from_bundle(_bundle(), limit=3) == refs[:3]
+    assert evidence_refs_from_bundle(_bundle(), limit=None) == refs
+
+
+def test_evidence_refs_stop_at_limit() -> None:
+    hunks = [
+        DiffHunk(file_path="p.c", old_start=i, old_count=0, new_start=i, new_count=1, lines=[], hunk_id=f"h{i}")
+        for i in range(100)
+    ]
+    bundle = EvidenceBundle(diff_hunks=hunks)
+    assert [r.stable_id for r in evidence_refs_from_bundle(bundle)] == [f"h{i}" for i in range(30)]
+    assert len(generate_reverse_context_report("1", bundle).evidence_refs) == 30
+    assert len(generate_fuzz_plan("1", bundle).evidence_refs) == 15
+
+
+def test_generators_use_precomputed_refs() -> None:
+    bundle = _bundle()
+    refs = evidence_refs_from_bundle(bundle)
+    assert generate_fuzz_plan("1", bundle, refs=refs[:2]).evidence_refs == refs[:2]
+    assert generate_reverse_context_report("1", bundle, refs=refs).evidence_refs == refs
+    assert generate_reverse_context_report("1", bundle).evidence_refs == refs
@@ -0,0 +1,199 @@
+"""Storage tests: evidence bundle parsing, queue round-trips and schema upgrades."""
+
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateTable
+
+from oss_sensor.config import Settings
+from oss_sensor.models import (
+    ArtifactKind,
+    EvidenceBundle,
+    LogTemplate,
+    ScoreResult,
+    TriageReport,
+    TriageState,
+    VulnHypotheses,
+)
+from oss_sensor.storage import BuildRow, DiffRow, Storage, _build_upsert
+
+
+def _storage() -> Storage:
+    return Storage(Settings(database_url="sqlite+aiosqlite:///:memory:"))
+
+
+def test_evidence_bundle_parsed_from_row() -> None:
+    storage = _storage()
+    bundle = EvidenceBundle(
+        log_templates=[
+            LogTemplate(
+                template_id="tpl_1", subsystem="default", category="default", format_string="x %@"
+            )
+        ]
+    )
+    row = DiffRow(id=1, evidence_bundle_json=bundle.model_dump_json())
+    assert storage.evidence_bundle(row) == bundle
+    assert storage.evidence_bundle(DiffRow(id=2, evidence_bundle_json=None)) == EvidenceBundle()
+
+
+async def test_diff_triage_and_score_round_trip(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)  # init_db creates ./data for SQLite URLs
+    storage = Storage(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path}/oss_sensor.db"))
+    await storage.init_db()
+    low = await storage.create_diff("B1", "B2", "syslogd", EvidenceBundle())
+    high = await storage.create_diff("B1", "B2", "configd", EvidenceBundle())
+    assert await storage.set_diff_score(high, ScoreResult(total_score=5.5, diff_id=str(high)))
+    assert not await storage.set_diff_score(999, ScoreResult(total_score=1.0, diff_id="999"))
+    assert await storage.update_diff_triage(low, TriageState.ACCEPTED, "looked")
+    assert not await storage.update_diff_triage(999, TriageState.ACCEPTED)
+
+    queue = await storage.get_queue()
+    assert [(q["diff_id"], q["score"], q["state"]) for q in queue] == [
+        (str(high), 5.5, "pending"),
+        (str(low), 0.0, "accepted"),
+    ]
+    assert [q["diff_id"] for q in await storage.get_queue(min_score=1.0)] == [str(high)]
+    assert [q["diff_id"] for q in await storage.get_queue(min_score=0.0)] == [str(high), str(low)]
+    assert [q["diff_id"] for q in await storage.get_queue(limit=1)] == [str(high)]
+    assert [q["notes"] for q in await storage.get_queue(state=TriageState.ACCEPTED)] == ["looked"]
+
+    triage = TriageReport(diff_id=str(high), summary="s", score_explanation="e")
+    ids = await storage.store_reports(
+        high, {"triage": triage, "vuln_hypotheses": VulnHypotheses(diff_id=str(high))}
+    )
+    assert len(ids) == 2 and ids[0] < ids[1]
+    reports = await storage.get_reports(high)
+    assert list(reports) == ["triage", "vuln_hypotheses"]
+    assert reports["triage"]["summary"] == "s"
+    assert await storage.get_reports(high) is reports
+    retriage = TriageReport(diff_id=str(high), summary="s2", score_explanation="e")
+    await storage.store_report(high, "triage", retriage)
+    assert (await storage.get_reports(high))["triage"]["summary"] == "s2"
+    assert await storage.get_reports(999) == {}
+    assert await storage.store_reports(high, {}) == []
+    await storage.close()
+
+
+async def test_get_queue_ranks_unscored_as_zero_and_breaks_ties_newest_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    storage = Storage(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path}/oss_sensor.db"))
+    await storage.init_db()
+    zero, unscored, first, second = [
+        await storage.create_diff("B1", "B2", comp, EvidenceBundle())
+        for comp in ("syslogd", "configd", "launchd", "notifyd")
+    ]
+    for diff_id, total in ((zero, 0.0), (first, 2.0), (second, 2.0)):
+        await storage.set_diff_score(diff_id, ScoreResult(total_score=total, diff_id=str(diff_id)))
+    queue = await storage.get_queue()
+    assert [(q["diff_id"], q["score"]) for q in queue] == [
+        (str(second), 2.0),
+        (str(first), 2.0),
+        (str(unscored), 0.0),
+        (str(zero), 0.0),
+    ]
+    await storage.close()
+
+
+async def test_store_artifact_materializes_build_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    storage = Storage(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path}/oss_sensor.db"))
+    await storage.init_db()
+    await storage.store_artifact("B1", "syslogd", ArtifactKind.SOURCE, "a", [])
+    await storage.store_artifact("B1", "syslogd", ArtifactKind.BINARY, "b", [])
+    await storage.ensure_build("B1")
+    async with storage._session() as session:
+        assert (await session.execute(select(BuildRow.id))).scalars().all() == ["B1"]
+    assert len(await storage.list_artifacts(build_id="B1", component="syslogd")) == 2
+    await storage.close()
+
+
+async def test_build_upsert_portable_fallback_is_idempotent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    storage = Storage(Settings(database_url=f"sqlite+aiosqlite:///{tmp_path}/oss_sensor.db"))
+    await storage.init_db()
+    # The INSERT ... SELECT used for dialects without ON CONFLICT, run here on SQLite.
+    async with storage._session() as session:
+        for _ in range(2):
+            await session.execute(_build_upsert("mysql", "B1"))
+        await session.commit()
+        assert (await session.execute(select(BuildRow.id))).scalars().all() == ["B1"]
+    await storage.close()
+
+
+# diffs as created before the total_score column existed.
+_LEGACY_DIFFS_DDL = """
+CREATE TABLE diffs (
+    id INTEGER NOT NULL,
+    build_from VARCHAR(64) NOT NULL,
+    build_to VARCHAR(64) NOT NULL,
+    component VARCHAR(128) NOT NULL,
+    evidence_bundle_json TEXT,
+    score_result_json TEXT,
+    state VARCHAR(32),
+    notes TEXT,
+    created_at DATETIME,
+    PRIMARY KEY (id)
+)
+"""
+
+
+async def test_init_db_upgrades_existing_database_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "oss_sensor.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute(_LEGACY_DIFFS_DDL)
+        conn.execute(
+            "INSERT INTO diffs (build_from, build_to, component, score_result_json, state) VALUES"
+            " ('B1', 'B2', 'syslogd', ?, 'pending'), ('B1', 'B2', 'configd', NULL, 'pending')",
+            (ScoreResult(total_score=4.5, diff_id="1").model_dump_json(),),
+        )
+    settings = Settings(database_url=f"sqlite+aiosqlite:///{db}")
+    workers = [Storage(settings) for _ in range(4)]  # API workers starting together
+    await asyncio.gather(*(w.init_db() for w in workers))
+    queue = await workers[0].get_queue()
+    assert [(q["component"], q["score"]) for q in queue] == [("syslogd", 4.5), ("configd", 0.0)]
+    assert [q["component"] for q in await workers[0].get_queue(min_score=1.0)] == ["syslogd"]
+    # The legacy created_at column has no default; a trigger stamps rows inserted from now on.
+    new_id = await workers[0].create_diff("B2", "B3", "syslogd", EvidenceBundle())
+    queue = await workers[0].get_queue(build_from="B2")
+    assert [q["diff_id"] for q in queue] == [str(new_id)] and queue[0]["created_at"] is not None
+    for w in workers:
+        await w.close()
+
+
+def test_timestamp_defaults_are_utc_per_dialect() -> None:
+    ddl = {
+        name: str(CreateTable(DiffRow.__table__).compile(dialect=dialect))
+        for name, dialect in (("sqlite", sqlite.dialect()), ("postgresql", postgresql.dialect()))
+    }
+    assert "created_at DATETIME DEFAULT CURRENT_TIMESTAMP" in ddl["sqlite"]
+    assert "DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP)" in ddl["postgresql"]
+
+
+async def test_in_memory_sqlite_urls_skip_pool_sizing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    for url in (
+        "sqlite+aiosqlite://",
+        "sqlite+aiosqlite:///:memory:",
+        "sqlite+aiosqlite:///file:oss_sensor?mode=memory&uri=true",
+    ):
+        storage = Storage(Settings(database_url=url))
+        await storage.init_db()
+        assert await storage.get_queue() == []
+        await storage.close()